@@ -1,27 +1,144 @@
+import functools
+import json
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import platform
+import shutil
+import stat
 import subprocess
+import sys
+
+try:
+    import winreg
+except ImportError:  # not on Windows
+    winreg = None
 
 import ezdxf
+import numpy as np
 from ezdxf.addons import odafc
+from platformdirs import user_cache_dir
 import csv
 from datetime import datetime
 import os
-from typing import Dict, List, Any, Optional
+from typing import ClassVar, Dict, List, Any, Optional
 from pathlib import Path
 
+
+def _stat_executable(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a path once and return the result if it is a regular, executable
+    file, else None. Replaces separate exists/access/getsize calls with a
+    single syscall.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    if stat.S_ISREG(st.st_mode) and (st.st_mode & 0o111):
+        return st
+    return None
+
+
+def _scan_depth(root: str, max_depth: int, targets: set):
+    """
+    Yield paths of files named in `targets` under `root`, descending at most
+    `max_depth` levels.
+
+    Uses a depth-limited BFS over os.scandir so subtrees beyond the depth
+    limit are pruned before they are ever visited, and DirEntry type checks
+    reuse the directory listing instead of issuing extra stat calls.
+    """
+    queue = deque([(root, 0)])
+
+    while queue:
+        directory, depth = queue.popleft()
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if entry.name in targets:
+                            yield entry.path
+                    elif entry.is_dir(follow_symlinks=False) and depth < max_depth:
+                        queue.append((entry.path, depth + 1))
+        except OSError:
+            continue
+
+
+@functools.lru_cache(maxsize=64)
+def _probe_oda_version(path: str, mtime: float) -> bool:
+    """
+    Run `<path> --version` and check the output for ODA markers.
+
+    Memoized on (path, mtime) so repeated candidates during one discovery
+    walk don't re-spawn the process.
+    """
+    result = subprocess.run(
+        [path, '--version'],
+        capture_output=True,
+        text=True,
+        timeout=2,  # 2 second timeout
+        stdin=subprocess.DEVNULL,
+        creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+    )
+
+    return ('ODA File Converter' in result.stdout or
+            'ODAFC' in result.stdout or
+            'version' in result.stdout.lower())
+
+def _line_bounds(dxf):
+    """Bounding points of a LINE as (x, y) 2-tuples."""
+    start = dxf.start
+    end = dxf.end
+    return [(start[0], start[1]), (end[0], end[1])]
+
+
+def _circle_bounds(dxf):
+    """Bounding-box corners of a CIRCLE or ARC as (x, y) 2-tuples."""
+    center = dxf.center
+    radius = dxf.radius
+    return [(center[0] - radius, center[1] - radius),
+            (center[0] + radius, center[1] + radius)]
+
+
+# Interned dxftype constants so hot-loop comparisons are identity checks
+_LINE = sys.intern('LINE')
+_CIRCLE = sys.intern('CIRCLE')
+_ARC = sys.intern('ARC')
+_ATTDEF = sys.intern('ATTDEF')
+
+# dxftype -> handler taking the entity's dxf namespace and returning points
+_BOUND_HANDLERS = {
+    _LINE: _line_bounds,
+    _CIRCLE: _circle_bounds,
+    _ARC: _circle_bounds
+}
+
+
 class MSIInstaller:
     def __init__(self, msi_path: str, log_file: str = "msi_install.log"):
         self.msi_path = os.path.abspath(msi_path)
         self.log_file = log_file
 
-        # Set up logging
-        logging.basicConfig(
-            filename=log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-        self.logger = logging.getLogger(__name__)
+        # Resolve msiexec once instead of paying PATH resolution inside
+        # CreateProcess on every install call
+        self._msiexec = shutil.which('msiexec.exe') or r'C:\Windows\System32\msiexec.exe'
+        self._base_cmd = [self._msiexec, '/i', self.msi_path]
+
+        # Set up logging without touching the root logger; attach the file
+        # handler only once no matter how many installers are constructed
+        self.logger = logging.getLogger("draftflow.msi")
+        self.logger.setLevel(logging.INFO)
+
+        log_path = os.path.abspath(log_file)
+        if not any(isinstance(h, logging.FileHandler) and h.baseFilename == log_path
+                   for h in self.logger.handlers):
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(message)s'))
+            self.logger.addHandler(file_handler)
 
     def install_msiexec(self, silent: bool = True, properties: dict = None) -> bool:
         """
@@ -35,23 +152,12 @@ class MSIInstaller:
             bool: True if installation successful, False otherwise
         """
         try:
-            if not os.path.exists(self.msi_path):
-                raise FileNotFoundError(f"MSI file not found: {self.msi_path}")
-
-            # Build command
-            cmd = ['msiexec.exe', '/i', self.msi_path]
-
-            # Add silent installation flags
-            if silent:
-                cmd.extend(['/quiet', '/norestart'])
-
-            # Add logging
-            cmd.extend(['/l*v', self.log_file])
-
-            # Add any additional properties
-            if properties:
-                for key, value in properties.items():
-                    cmd.append(f'{key}={value}')
+            # Build command: precomputed base + silent flags + logging +
+            # any additional properties
+            cmd = (self._base_cmd
+                   + (['/quiet', '/norestart'] if silent else [])
+                   + ['/l*v', self.log_file]
+                   + [f'{key}={value}' for key, value in (properties or {}).items()])
 
             self.logger.info(f"Starting installation with command: {' '.join(cmd)}")
 
@@ -117,6 +223,15 @@ class MSIInstaller:
 
 class ODAConverter:
 
+    # Resolved converter path shared by all instances; discovery only runs
+    # once per process and is persisted across runs in _CACHE_FILE.
+    _resolved_path: ClassVar[Optional[str]] = None
+    _CACHE_FILE: ClassVar[Path] = Path(user_cache_dir()) / "draftflow" / "oda_path.json"
+
+    # Absolute paths whose --version probe already failed this process;
+    # a 5s-timeout subprocess is never re-spawned for these
+    _failed_probes: ClassVar[set] = set()
+
     def __init__(self, oda_path: Optional[str] = None, log_file: Optional[str] = None):
         """
         Initialize the ODA Converter.
@@ -129,7 +244,54 @@ class ODAConverter:
 
         self.ENVVAR_ODA_PATH = 'ODA_CONVERTER_PATH'
 
-        self.oda_path = oda_path or self._find_windows_oda() or self._find_mac_oda() or self._find_linux_oda()
+        self.oda_path = oda_path or self._get_cached_path()
+        if not self.oda_path:
+            self.oda_path = self._find_windows_oda() or self._find_mac_oda() or self._find_linux_oda()
+            if self.oda_path:
+                self._store_cached_path(self.oda_path)
+
+    def _get_cached_path(self) -> Optional[str]:
+        """Return the cached converter path (class-level, then on-disk)."""
+        cls = type(self)
+
+        if cls._resolved_path and self._verify_oda_path(cls._resolved_path):
+            return cls._resolved_path
+
+        try:
+            with open(cls._CACHE_FILE, encoding='utf-8') as f:
+                cached = json.load(f)
+            path = cached.get('path')
+            if path and os.path.getmtime(path) == cached.get('mtime') and self._verify_oda_path(path):
+                cls._resolved_path = path
+                return path
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"No usable ODA path cache: {str(e)}")
+
+        return None
+
+    def _store_cached_path(self, path: str):
+        """Remember a verified converter path for future instantiations."""
+        cls = type(self)
+        cls._resolved_path = path
+
+        try:
+            cls._CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(cls._CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'path': path, 'mtime': os.path.getmtime(path)}, f)
+        except OSError as e:
+            self.logger.debug(f"Could not persist ODA path cache: {str(e)}")
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Forget the cached converter path so the next instance re-discovers it."""
+        cls._resolved_path = None
+        cls._registry_install_path = None
+        cls._failed_probes.clear()
+        _probe_oda_version.cache_clear()
+        try:
+            cls._CACHE_FILE.unlink()
+        except OSError:
+            pass
 
     def _setup_logging(self, log_file: Optional[str]):
 
@@ -140,14 +302,19 @@ class ODAConverter:
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
         if log_file:
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+            log_path = os.path.abspath(log_file)
+            if not any(isinstance(h, logging.FileHandler) and h.baseFilename == log_path
+                       for h in self.logger.handlers):
+                file_handler = logging.FileHandler(log_file)
+                file_handler.setLevel(logging.DEBUG)
+                file_handler.setFormatter(formatter)
+                self.logger.addHandler(file_handler)
+
+        # One console handler total, not one per instantiation
+        if not any(type(h) is logging.StreamHandler for h in self.logger.handlers):
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            self.logger.addHandler(console_handler)
 
     def find_oda_converter(self):
         oda_path = os.environ.get(self.ENVVAR_ODA_PATH)
@@ -183,12 +350,34 @@ class ODAConverter:
 
         return oda_path
 
-    def _find_windows_oda(self) -> Optional[str]:
-        """Find ODA File Converter on Windows systems."""
-        # List of possible executable names
-        exe_names = ['ODAFileConverter.exe', 'ODAFC.exe']
+    # Registry install path resolved once per process; False means the
+    # registry was already probed and had nothing
+    _registry_install_path: ClassVar[Any] = None
 
-        # Check Windows Registry first
+    @staticmethod
+    def _probe_registry(reg_root, reg_path) -> Optional[str]:
+        """Read the ODA InstallPath value from one registry key, if present."""
+        try:
+            with winreg.OpenKey(reg_root, reg_path) as key:
+                install_path, _ = winreg.QueryValueEx(key, "InstallPath")
+                return install_path
+        except OSError:
+            return None
+
+    def _find_registry_install_path(self) -> Optional[str]:
+        """
+        Look up the ODA install path in the Windows registry, probing the
+        three independent roots concurrently and memoizing the result on
+        the class so repeat discovery within one process is free.
+        """
+        if winreg is None:
+            return None
+
+        cls = type(self)
+        if cls._registry_install_path is not None:
+            return cls._registry_install_path or None
+
+        install_path = None
         try:
             registry_paths = [
                 (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\ODA\ODAFileConverter"),
@@ -196,23 +385,35 @@ class ODAConverter:
                 (winreg.HKEY_CURRENT_USER, r"SOFTWARE\ODA\ODAFileConverter")
             ]
 
-            for reg_root, reg_path in registry_paths:
-                try:
-                    with winreg.OpenKey(reg_root, reg_path) as key:
-                        install_path, _ = winreg.QueryValueEx(key, "InstallPath")
-                        self.logger.debug(f"Found registry entry: {install_path}")
-
-                        # Check for executable in install path
-                        for exe in exe_names:
-                            full_path = os.path.join(install_path, exe)
-                            if self._verify_oda_path(full_path):
-                                return full_path
-                except WindowsError:
-                    continue
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [executor.submit(self._probe_registry, root, path)
+                           for root, path in registry_paths]
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result:
+                        self.logger.debug(f"Found registry entry: {result}")
+                        install_path = result
+                        break
 
         except Exception as e:
             self.logger.debug(f"Error checking registry: {str(e)}")
 
+        cls._registry_install_path = install_path or False
+        return install_path
+
+    def _find_windows_oda(self) -> Optional[str]:
+        """Find ODA File Converter on Windows systems."""
+        # List of possible executable names
+        exe_names = ['ODAFileConverter.exe', 'ODAFC.exe']
+
+        # Check Windows Registry first
+        install_path = self._find_registry_install_path()
+        if install_path:
+            for exe in exe_names:
+                full_path = os.path.join(install_path, exe)
+                if self._verify_oda_path(full_path):
+                    return full_path
+
         # Common installation paths
         common_paths = [
             os.path.join(os.environ.get('ProgramFiles', ''), 'ODA'),
@@ -225,30 +426,38 @@ class ODAConverter:
             r'C:\Program Files (x86)\ODA'
         ]
 
-        # Search common paths
+        # Drop duplicates (e.g. ProgramFiles == ProgramFiles(x86) on 32-bit
+        # hosts) so each tree is only scanned once
+        common_paths = list(dict.fromkeys(common_paths))
+
+        # Search common paths up to 2 levels deep, stopping on first hit
         for base_path in common_paths:
             if os.path.exists(base_path):
-                # Search recursively up to 2 levels deep
-                for root, dirs, files in os.walk(base_path):
-                    if root.count(os.sep) - base_path.count(os.sep) > 2:
-                        continue
-
-                    for exe in exe_names:
-                        if exe in files:
-                            full_path = os.path.join(root, exe)
-                            if self._verify_oda_path(full_path):
-                                return full_path
+                for hit in _scan_depth(base_path, 2, set(exe_names)):
+                    if self._verify_oda_path(hit):
+                        return hit
 
         # Check PATH environment variable
         path_dirs = os.environ.get('PATH', '').split(os.pathsep)
-        for directory in path_dirs:
-            for exe in exe_names:
-                full_path = os.path.join(directory, exe)
-                if self._verify_oda_path(full_path):
-                    return full_path
+        candidates = [os.path.join(directory, exe)
+                      for directory in path_dirs
+                      for exe in exe_names]
+        for full_path in self._filter_candidates(candidates):
+            if self._verify_oda_path(full_path):
+                return full_path
 
         return None
 
+    @staticmethod
+    def _filter_candidates(candidates: List[str]) -> List[str]:
+        """
+        Deduplicate candidate paths (order-preserving) and keep only those
+        that exist and are executable, so misses never reach the expensive
+        --version probe.
+        """
+        return [c for c in dict.fromkeys(candidates)
+                if _stat_executable(c) is not None]
+
     def _find_mac_oda(self) -> Optional[str]:
         """Find ODA File Converter on macOS systems."""
         common_paths = [
@@ -257,14 +466,16 @@ class ODAConverter:
             os.path.expanduser('~/Applications/ODAFileConverter.app/Contents/MacOS/ODAFileConverter')
         ]
 
-        # Also check Homebrew and MacPorts locations
-        brew_path = subprocess.getoutput('brew --prefix').strip()
-        if brew_path and os.path.exists(brew_path):
-            common_paths.append(os.path.join(brew_path, 'bin/ODAFileConverter'))
+        # Also check Homebrew and MacPorts locations; the prefix is a
+        # well-known directory, no need to shell out to `brew --prefix`
+        brew_prefix = os.environ.get('HOMEBREW_PREFIX') or next(
+            (p for p in ('/opt/homebrew', '/usr/local') if os.path.isdir(p)), None)
+        if brew_prefix:
+            common_paths.append(os.path.join(brew_prefix, 'bin/ODAFileConverter'))
 
         common_paths.append('/opt/local/bin/ODAFileConverter')  # MacPorts
 
-        for path in common_paths:
+        for path in self._filter_candidates(common_paths):
             if self._verify_oda_path(path):
                 return path
 
@@ -289,15 +500,12 @@ class ODAConverter:
 
         common_paths.extend(package_paths)
 
-        # Try to find using 'which' command
-        try:
-            which_result = subprocess.getoutput('which ODAFileConverter').strip()
-            if which_result and os.path.exists(which_result):
-                common_paths.append(which_result)
-        except Exception:
-            pass
+        # Scan PATH in-process instead of shelling out to `which`
+        which_result = shutil.which('ODAFileConverter')
+        if which_result:
+            common_paths.append(which_result)
 
-        for path in common_paths:
+        for path in self._filter_candidates(common_paths):
             if self._verify_oda_path(path):
                 return path
 
@@ -313,29 +521,31 @@ class ODAConverter:
         Returns:
             bool: True if path is valid ODA Converter executable
         """
-        if not path or not os.path.exists(path):
+        if not path:
             return False
 
-        try:
-            # Check if file is executable
-            if not os.access(path, os.X_OK):
-                return False
+        abs_path = os.path.abspath(path)
+        if abs_path in self._failed_probes:
+            return False
 
-            # Try to run with --version flag
-            result = subprocess.run(
-                [path, '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5  # 5 second timeout
-            )
+        # Reject obvious non-converters before paying for a subprocess:
+        # wrong filename or a file far too small to be the real binary
+        name = os.path.basename(path).lower()
+        if not (name.startswith('odafileconverter') or name in ('odafc', 'odafc.exe')):
+            return False
 
-            # Check if output contains typical ODA version information
-            return ('ODA File Converter' in result.stdout or
-                    'ODAFC' in result.stdout or
-                    'version' in result.stdout.lower())
+        # One stat covers existence, file type, executability and size
+        st = _stat_executable(path)
+        if st is None or st.st_size < 1_000_000:
+            return False
+
+        try:
+            # Try to run with --version flag (memoized per path + mtime)
+            return _probe_oda_version(path, st.st_mtime)
 
         except (subprocess.SubprocessError, OSError) as e:
             self.logger.debug(f"Error verifying ODA path {path}: {str(e)}")
+            self._failed_probes.add(abs_path)
             return False
 
     def _search_additional_locations(self) -> Optional[str]:
@@ -361,6 +571,32 @@ class ODAConverter:
 
 
 class DXFBlockExporter:
+
+    # $INSUNITS header value -> human-readable unit name
+    _UNITS_MAP = {
+        0: 'None',
+        1: 'Inches',
+        2: 'Feet',
+        3: 'Miles',
+        4: 'Millimeters',
+        5: 'Centimeters',
+        6: 'Meters',
+        7: 'Kilometers',
+        8: 'Microinches',
+        9: 'Mils',
+        10: 'Yards',
+        11: 'Angstroms',
+        12: 'Nanometers',
+        13: 'Microns',
+        14: 'Decimeters',
+        15: 'Dekameters',
+        16: 'Hectometers',
+        17: 'Gigameters',
+        18: 'Astronomical units',
+        19: 'Light years',
+        20: 'Parsecs'
+    }
+
     def __init__(self, filename: str):
         """
         Initialize the DXF document.
@@ -368,120 +604,144 @@ class DXFBlockExporter:
         Args:
             filename: Path to the DWG/DXF file
         """
+        # .dwg goes through the ODA converter; .dxf is read directly
+        # through a large buffer so cold-cache opens stay sequential
         try:
-            # Load the drawing
-            self.doc = ezdxf.readfile(filename)  ##todo: ensure that it's a dxf file and not a dwg file
+            if Path(filename).suffix.lower() == '.dwg':
+                self.doc = odafc.readfile(filename)
+            else:
+                self.doc = self._read_buffered(filename)
             self.modelspace = self.doc.modelspace()
             self.filename = filename
         except Exception as e:
             print(f"Error loading file {filename}: {str(e)}")
             raise
 
+    @staticmethod
+    def _read_buffered(filename: str):
+        """Load a DXF document through a 1 MiB read buffer."""
+        from ezdxf.filemanagement import dxf_file_info
+        from ezdxf.lldxf.validator import is_binary_dxf_file
+
+        # Binary DXF can't go through the text-stream path; readfile has
+        # its own loader for it
+        if is_binary_dxf_file(filename):
+            return ezdxf.readfile(filename)
+
+        try:
+            info = dxf_file_info(filename)
+            with open(filename, mode='rt', encoding=info.encoding,
+                      errors='surrogateescape', buffering=1 << 20) as fp:
+                doc = ezdxf.read(fp)
+            doc.filename = filename
+            return doc
+        except (IOError, ezdxf.DXFError):
+            # Odd structure or encoding: let readfile's own detection run
+            return ezdxf.readfile(filename)
+
     def get_block_data(self) -> List[Dict[str, Any]]:
         """Extract information about all blocks in the drawing."""
-        blocks_data = []
+        return list(self.iter_block_data())
 
+    def iter_block_data(self):
+        """Yield information about each block in the drawing."""
         try:
-            # Get the block table
-            block_table = self.doc.blocks
-
-            # Process each block
-            for block in block_table:
-                try:
-                    # Skip model and paper space blocks
-                    if block.name.startswith('*'):
-                        continue
-
-                    # Get block bounds
-                    bounds = self._get_block_bounds(block)
-
-                    # Count entities and get attributes
-                    entity_count = 0
-                    attribute_names = []
-
-                    for entity in block:
-                        if entity.dxftype() == 'ATTDEF':
-                            attribute_names.append(entity.dxf.tag)
-                        else:
-                            entity_count += 1
-
-                    # Get extended data (if any)
-                    xdata = self._get_xdata(block)
-
-                    block_data = {
-                        "Name": block.name,
-                        "Description": xdata.get('DESCRIPTION', ''),
-                        "Layer": block.dxf.layer if hasattr(block.dxf, 'layer') else '0',
-                        "Width": round(bounds['width'], 3) if bounds else 0,
-                        "Height": round(bounds['height'], 3) if bounds else 0,
-                        "EntityCount": entity_count,
-                        "HasAttributes": len(attribute_names) > 0,
-                        "AttributeNames": '|'.join(attribute_names),
-                        "Units": self._get_units_string(),
-                        "LastModified": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "Author": xdata.get('AUTHOR', ''),
-                        "Category": xdata.get('CATEGORY', ''),
-                        "EntityTypes": self._get_entity_types(block)
-                    }
-
-                    blocks_data.append(block_data)
-
-                except Exception as e:
-                    print(f"Error processing block {block.name}: {str(e)}")
-                    continue
+            # Get the block table, skipping model and paper space blocks
+            blocks = [block for block in self.doc.blocks
+                      if not block.name.startswith('*')]
+
+            # Constant for the whole export; no need to recompute per block
+            units_str = self._get_units_string()
+            now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         except Exception as e:
             print(f"Error accessing block table: {str(e)}")
             raise
 
-        return blocks_data
-
-    def _get_block_bounds(self, block) -> Dict[str, float]:
-        """Calculate the bounding box of a block."""
+        # Fan block processing out over a small thread pool; map preserves
+        # block order so results still stream in table order
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            for block_data in executor.map(
+                    lambda block: self._process_block(block, units_str, now_str),
+                    blocks):
+                if block_data is not None:
+                    yield block_data
+
+    def _process_block(self, block, units_str: str, now_str: str) -> Optional[Dict[str, Any]]:
+        """Build the export row for one block; None if processing failed."""
         try:
-            points = []
-
-            for entity in block:
-                # Get bounding points based on entity type
-                if entity.dxftype() == 'LINE':
-                    points.extend([entity.dxf.start, entity.dxf.end])
-                elif entity.dxftype() == 'CIRCLE':
-                    center = entity.dxf.center
-                    radius = entity.dxf.radius
-                    points.extend([
-                        (center[0] - radius, center[1] - radius),
-                        (center[0] + radius, center[1] + radius)
-                    ])
-                elif entity.dxftype() == 'ARC':
-                    center = entity.dxf.center
-                    radius = entity.dxf.radius
-                    points.extend([
-                        (center[0] - radius, center[1] - radius),
-                        (center[0] + radius, center[1] + radius)
-                    ])
-                elif hasattr(entity, 'get_points'):
-                    points.extend(entity.get_points())
-
-            if not points:
-                return None
-
-            # Calculate bounds
-            x_coords = [p[0] for p in points]
-            y_coords = [p[1] for p in points]
+            # Collect bounds, counts, attributes and types in one pass
+            points, entity_count, attribute_names, type_set = self._scan_block(block)
+
+            if points:
+                # Single C-level min/max reduction instead of four
+                # Python passes over the coordinate lists
+                pts = np.asarray(points, dtype=np.float64)
+                width, height = (pts.max(axis=0) - pts.min(axis=0)).tolist()
+            else:
+                width = height = 0
+
+            # Get extended data (if any)
+            xdata = self._get_xdata(block)
 
             return {
-                'width': max(x_coords) - min(x_coords),
-                'height': max(y_coords) - min(y_coords),
-                'min_x': min(x_coords),
-                'min_y': min(y_coords),
-                'max_x': max(x_coords),
-                'max_y': max(y_coords)
+                "Name": block.name,
+                "Description": xdata.get('DESCRIPTION', ''),
+                "Layer": block.dxf.layer if hasattr(block.dxf, 'layer') else '0',
+                "Width": round(width, 3),
+                "Height": round(height, 3),
+                "EntityCount": entity_count,
+                "HasAttributes": len(attribute_names) > 0,
+                "AttributeNames": '|'.join(attribute_names),
+                "Units": units_str,
+                "LastModified": now_str,
+                "Author": xdata.get('AUTHOR', ''),
+                "Category": xdata.get('CATEGORY', ''),
+                "EntityTypes": '|'.join(sorted(type_set))
             }
 
         except Exception as e:
-            print(f"Error calculating block bounds: {str(e)}")
+            print(f"Error processing block {block.name}: {str(e)}")
             return None
 
+    def _scan_block(self, block):
+        """
+        Scan a block in a single pass, gathering everything get_block_data
+        needs: bounding points, entity count (excluding ATTDEFs), attribute
+        tags and the set of entity types.
+        """
+        points = []
+        entity_count = 0
+        attr_names = []
+        type_set = set()
+
+        # Local bindings keep attribute lookups out of the innermost loop
+        bound_handlers = _BOUND_HANDLERS
+        intern = sys.intern
+        add_type = type_set.add
+        extend_points = points.extend
+
+        for entity in block:
+            # ezdxf returns its class constant, so interning is a cheap
+            # lookup that licenses identity comparisons below
+            dxftype = intern(entity.dxftype())
+            add_type(dxftype)
+
+            if dxftype is _ATTDEF:
+                attr_names.append(entity.dxf.tag)
+                continue
+
+            entity_count += 1
+
+            # Gather bounding points as (x, y) 2-tuples based on entity type
+            handler = bound_handlers.get(dxftype)
+            if handler is not None:
+                extend_points(handler(entity.dxf))
+            elif hasattr(entity, 'get_points'):
+                extend_points((p[0], p[1]) for p in entity.get_points())
+
+        return points, entity_count, attr_names, type_set
+
     def _get_xdata(self, block) -> Dict[str, str]:
         """Get extended data from a block."""
         xdata = {}
@@ -496,39 +756,8 @@ class DXFBlockExporter:
 
     def _get_units_string(self) -> str:
         """Get the drawing units as a string."""
-        units_map = {
-            0: 'None',
-            1: 'Inches',
-            2: 'Feet',
-            3: 'Miles',
-            4: 'Millimeters',
-            5: 'Centimeters',
-            6: 'Meters',
-            7: 'Kilometers',
-            8: 'Microinches',
-            9: 'Mils',
-            10: 'Yards',
-            11: 'Angstroms',
-            12: 'Nanometers',
-            13: 'Microns',
-            14: 'Decimeters',
-            15: 'Dekameters',
-            16: 'Hectometers',
-            17: 'Gigameters',
-            18: 'Astronomical units',
-            19: 'Light years',
-            20: 'Parsecs'
-        }
-
         units = self.doc.header.get('$INSUNITS', 0)
-        return units_map.get(units, 'Unknown')
-
-    def _get_entity_types(self, block) -> str:
-        """Get a list of unique entity types in the block."""
-        types = set()
-        for entity in block:
-            types.add(entity.dxftype())
-        return '|'.join(sorted(types))
+        return self._UNITS_MAP.get(units, 'Unknown')
 
     def export_to_csv(self, output_path: str = None) -> str:
         """
@@ -542,9 +771,6 @@ class DXFBlockExporter:
             The path to the created CSV file.
         """
         try:
-            # Get block data
-            blocks_data = self.get_block_data()
-
             # If no output path provided, create one on desktop
             if not output_path:
                 desktop = str(Path.home() / "Desktop")
@@ -563,9 +789,15 @@ class DXFBlockExporter:
 
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
-                writer.writerows(blocks_data)
 
-            print(f"Exported {len(blocks_data)} blocks to: {output_path}")
+                # Stream rows as blocks are scanned instead of materializing
+                # the whole list first
+                block_count = 0
+                for row in self.iter_block_data():
+                    writer.writerow(row)
+                    block_count += 1
+
+            print(f"Exported {block_count} blocks to: {output_path}")
             return output_path
 
         except Exception as e:
@@ -5,6 +5,15 @@ import os
 from base64 import b64encode
 from datetime import datetime, timedelta
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # fall back to stdlib parsing
+    _loads = json.loads
+
 
 class AutodeskDesignAutomation:
     def __init__(self, client_id, client_secret):
@@ -18,6 +27,27 @@ class AutodeskDesignAutomation:
         self.auth_url = "https://developer.api.autodesk.com/authentication/v2/token"
         self.da_url = "https://developer.api.autodesk.com/da/us-east/v3"
 
+        # Shared session: keep-alive avoids a fresh TCP+TLS handshake on
+        # every API call (the polling loop in particular)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+
+    def _get_json(self, url, **kwargs):
+        """GET a URL with a valid token and parse the JSON response."""
+        self.get_access_token()
+        response = self.session.get(url, **kwargs)
+        response.raise_for_status()
+        return _loads(response.content)
+
     def get_access_token(self):
         """Get or refresh the access token for API calls."""
         # Check if we need a new token
@@ -33,11 +63,14 @@ class AutodeskDesignAutomation:
             }
 
             # Request new token
-            response = requests.post(self.auth_url, data=auth_data)
+            response = self.session.post(self.auth_url, data=auth_data)
             response.raise_for_status()
 
-            token_data = response.json()
+            token_data = _loads(response.content)
             self.access_token = token_data['access_token']
+            # Carry the token on the session so per-call header dicts
+            # aren't rebuilt for every request
+            self.session.headers['Authorization'] = f'Bearer {self.access_token}'
             # Set token expiry (subtract 5 minutes for safety margin)
             self.token_expiry = datetime.now() + timedelta(
                 seconds=token_data['expires_in'] - 300)
@@ -46,10 +79,7 @@ class AutodeskDesignAutomation:
 
     def create_activity(self):
         """Create a new Design Automation activity for DWG conversion."""
-        headers = {
-            'Authorization': f'Bearer {self.get_access_token()}',
-            'Content-Type': 'application/json'
-        }
+        self.get_access_token()
 
         # Define the activity
         activity_data = {
@@ -75,35 +105,34 @@ class AutodeskDesignAutomation:
             }
         }
 
-        response = requests.post(
+        response = self.session.post(
             f'{self.da_url}/activities/DwgToJson',
-            headers=headers,
             json=activity_data
         )
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     def upload_file(self, file_path):
         """Upload a DWG file to Autodesk storage."""
-        headers = {
-            'Authorization': f'Bearer {self.get_access_token()}'
-        }
-
         # Get signed URL for upload
-        signed_url_response = requests.get(
+        signed_url_data = self._get_json(
             f'{self.da_url}/signedurls/dwg',
-            headers=headers,
             params={'format': 'binary'}
         )
-        signed_url_response.raise_for_status()
-        signed_url_data = signed_url_response.json()
 
-        # Upload file to signed URL
+        # Upload file to signed URL; sending Content-Length up front lets
+        # the server stream the body instead of using chunked encoding
         with open(file_path, 'rb') as f:
-            upload_response = requests.put(
+            upload_response = self.session.put(
                 signed_url_data['signedUrl'],
                 data=f,
-                headers={'Content-Type': 'application/octet-stream'}
+                headers={
+                    # Signed URLs carry their own auth; suppress the
+                    # session-level bearer token for this request
+                    'Authorization': None,
+                    'Content-Type': 'application/octet-stream',
+                    'Content-Length': str(os.path.getsize(file_path))
+                }
             )
             upload_response.raise_for_status()
 
@@ -111,10 +140,7 @@ class AutodeskDesignAutomation:
 
     def submit_workitem(self, input_url):
         """Submit a work item to process the DWG file."""
-        headers = {
-            'Authorization': f'Bearer {self.get_access_token()}',
-            'Content-Type': 'application/json'
-        }
+        self.get_access_token()
 
         # Prepare work item data
         workitem_data = {
@@ -130,40 +156,32 @@ class AutodeskDesignAutomation:
             }
         }
 
-        response = requests.post(
+        response = self.session.post(
             f'{self.da_url}/workitems',
-            headers=headers,
             json=workitem_data
         )
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     def check_workitem_status(self, workitem_id):
         """Check the status of a work item."""
-        headers = {
-            'Authorization': f'Bearer {self.get_access_token()}'
-        }
-
-        response = requests.get(
-            f'{self.da_url}/workitems/{workitem_id}',
-            headers=headers
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_json(f'{self.da_url}/workitems/{workitem_id}')
 
     def download_result(self, result_url, output_path):
         """Download the resulting JSON file."""
-        headers = {
-            'Authorization': f'Bearer {self.get_access_token()}'
-        }
+        self.get_access_token()
 
-        response = requests.get(result_url, headers=headers)
-        response.raise_for_status()
+        # Stream to disk in 1 MiB chunks so memory stays flat regardless
+        # of payload size
+        with self.session.get(result_url, stream=True) as response:
+            response.raise_for_status()
 
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+            with open(output_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if chunk:
+                        f.write(chunk)
 
-    def process_dwg(self, input_file, output_file):
+    def process_dwg(self, input_file, output_file, timeout=600):
         """Process a DWG file and convert it to JSON metadata."""
         try:
             print("1. Uploading DWG file...")
@@ -174,6 +192,11 @@ class AutodeskDesignAutomation:
             workitem_id = workitem['id']
 
             print("3. Monitoring progress...")
+            # Poll with exponential backoff: short jobs finish within the
+            # first few quick checks, long jobs back off to one request
+            # every 10s instead of hammering the API
+            delay = 0.25
+            deadline = time.monotonic() + timeout
             while True:
                 status = self.check_workitem_status(workitem_id)
                 if status['status'] == 'success':
@@ -182,7 +205,12 @@ class AutodeskDesignAutomation:
                 elif status['status'] in ['failed', 'cancelled']:
                     raise Exception(f"Work item failed: {status.get('error', 'Unknown error')}")
 
-                time.sleep(5)  # Wait before checking again
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Work item {workitem_id} did not finish within {timeout}s")
+
+                time.sleep(delay)
+                delay = min(delay * 2, 10.0)
 
             print("4. Downloading result...")
             self.download_result(result_url, output_file)